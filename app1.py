@@ -1,13 +1,23 @@
 import gradio as gr
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import json
+import time
 
 # Initialize data storage - use a more robust approach for HF deployment
 import os
-transactions = []
+# Each app variant keeps its own file beside the script, since their currencies differ
+TRANSACTIONS_PATH = os.environ.get(
+    "TRANSACTIONS_PATH",
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        f"{os.path.splitext(os.path.basename(__file__))[0]}_transactions.parquet"
+    )
+)
 
 # Predefined categories
 EXPENSE_CATEGORIES = [
@@ -21,34 +31,143 @@ INCOME_CATEGORIES = [
     "Rental Income", "Gifts", "Other"
 ]
 
+# Known-ahead categories so type/category filters and groupbys run on integer codes
+TYPE_DTYPE = pd.CategoricalDtype(["Income", "Expense"])
+CATEGORY_DTYPE = pd.CategoricalDtype(list(dict.fromkeys(EXPENSE_CATEGORIES + INCOME_CATEGORIES)))
+# Lookup tables from categorical codes back to labels and from types to codes
+_CATEGORY_LABELS = CATEGORY_DTYPE.categories.to_numpy()
+_TYPE_CODES = {t: code for code, t in enumerate(TYPE_DTYPE.categories)}
+_CATEGORY_CODES = {c: code for code, c in enumerate(CATEGORY_DTYPE.categories)}
+
+# Chart colors, resolved once instead of per figure
+_EXPENSE_COLORS = list(px.colors.qualitative.Set3)
+_INCOME_COLORS = list(px.colors.qualitative.Pastel1)
+_TYPE_COLORS = {'Income': '#2E8B57', 'Expense': '#DC143C'}
+
+# Struct-of-arrays transaction store: one typed buffer per column, grown by
+# doubling, with rows [0, _n) live. Type and category hold categorical codes
+# and timestamps are integer nanoseconds since the epoch.
+_N_CAP = 1024
+_COLUMN_DTYPES = {
+    'id': 'uint32',
+    'type': 'int8',
+    'category': 'int8',
+    'amount': 'float64',
+    'description': object,
+    'date': 'datetime64[ns]',
+    'timestamp': 'int64'
+}
+_buffers = {column: np.empty(_N_CAP, dtype) for column, dtype in _COLUMN_DTYPES.items()}
+_n = 0
+# Earliest and latest stored dates, so out-of-range periods skip the search
+_min_date = pd.Timestamp.max.to_datetime64()
+_max_date = pd.Timestamp.min.to_datetime64()
+
+def _reserve(n_rows):
+    """Grow the column buffers by doubling until they hold n_rows"""
+    global _buffers
+    
+    capacity = len(_buffers['id'])
+    if n_rows <= capacity:
+        return
+    while capacity < n_rows:
+        capacity *= 2
+    
+    grown = {}
+    for column, buffer in _buffers.items():
+        grown[column] = np.empty(capacity, buffer.dtype)
+        grown[column][:_n] = buffer[:_n]
+    _buffers = grown
+
+def _store_view():
+    """Wrap the live rows of the buffers in a DataFrame without copying them"""
+    return pd.DataFrame({
+        'id': _buffers['id'][:_n],
+        'type': pd.Categorical.from_codes(_buffers['type'][:_n], dtype=TYPE_DTYPE, validate=False),
+        'category': pd.Categorical.from_codes(_buffers['category'][:_n], dtype=CATEGORY_DTYPE, validate=False),
+        'amount': _buffers['amount'][:_n],
+        # Kept as object so the view shares the buffer; a string dtype would copy it
+        'description': pd.Series(_buffers['description'][:_n], dtype=object, copy=False),
+        'date': _buffers['date'][:_n],
+        'timestamp': _buffers['timestamp'][:_n]
+    }, copy=False)
+
+def _load_store():
+    """Fill the buffers from saved transactions, if there are any"""
+    global _n, _min_date, _max_date
+    
+    if not os.path.exists(TRANSACTIONS_PATH):
+        return
+    
+    saved = pd.read_parquet(TRANSACTIONS_PATH, memory_map=True)
+    n_rows = len(saved)
+    _reserve(n_rows)
+    _buffers['type'][:n_rows] = saved['type'].astype(TYPE_DTYPE).cat.codes
+    _buffers['category'][:n_rows] = saved['category'].astype(CATEGORY_DTYPE).cat.codes
+    if pd.api.types.is_datetime64_any_dtype(saved['timestamp']):
+        # Files saved before timestamps were stored as integer nanoseconds
+        saved['timestamp'] = saved['timestamp'].astype('datetime64[ns]').astype('int64')
+    for column in ['id', 'amount', 'description', 'date', 'timestamp']:
+        _buffers[column][:n_rows] = saved[column].to_numpy(dtype=_COLUMN_DTYPES[column])
+    _n = n_rows
+    if n_rows:
+        _min_date = _buffers['date'][:n_rows].min()
+        _max_date = _buffers['date'][:n_rows].max()
+
+def save_transactions():
+    """Write the transaction store to disk as Parquet"""
+    # Write beside the file and swap it in, so a memory-mapped original is never truncated
+    tmp_path = f"{TRANSACTIONS_PATH}.tmp"
+    try:
+        _STORE.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, TRANSACTIONS_PATH)
+    except Exception:
+        # Don't leave a partial file behind
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+_load_store()
+_STORE = _store_view()
+
 def add_transaction(transaction_type, category, amount, description, date):
     """Add a new transaction to the database"""
-    global transactions
+    global _STORE, _n, _min_date, _max_date
     
     try:
         if not amount or amount <= 0:
             return "❌ Please enter a valid amount", get_recent_transactions()
         
-        if not category:
+        if transaction_type not in TYPE_DTYPE.categories:
+            return "❌ Please select a transaction type", get_recent_transactions()
+        
+        if not category or category not in CATEGORY_DTYPE.categories:
             return "❌ Please select a category", get_recent_transactions()
         
         # Validate date format
         try:
-            datetime.strptime(date, "%Y-%m-%d")
+            parsed_date = datetime.strptime(date, "%Y-%m-%d")
         except ValueError:
             return "❌ Please enter date in YYYY-MM-DD format", get_recent_transactions()
         
-        transaction = {
-            'id': len(transactions) + 1,
-            'type': transaction_type,
-            'category': category,
-            'amount': float(amount),
-            'description': description or "No description",
-            'date': date,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        transactions.append(transaction)
+        _reserve(_n + 1)
+        _buffers['id'][_n] = _n + 1
+        _buffers['type'][_n] = _TYPE_CODES[transaction_type]
+        _buffers['category'][_n] = _CATEGORY_CODES[category]
+        _buffers['amount'][_n] = float(amount)
+        _buffers['description'][_n] = description or "No description"
+        _buffers['date'][_n] = np.datetime64(parsed_date, 'ns')
+        _min_date = min(_min_date, _buffers['date'][_n])
+        _max_date = max(_max_date, _buffers['date'][_n])
+        _buffers['timestamp'][_n] = time.time_ns()
+        _n += 1
+        _STORE = _store_view()
+        # Rewrite the file on every insert so a confirmed transaction survives a kill.
+        # A failed write keeps the row and only warns, since a retry would add it twice
+        try:
+            save_transactions()
+        except Exception as e:
+            return f"⚠️ {transaction_type} of ${amount:.2f} added, but could not be saved to disk: {str(e)}", get_recent_transactions()
         
         success_msg = f"✅ {transaction_type} of ${amount:.2f} added successfully!"
         return success_msg, get_recent_transactions()
@@ -58,68 +177,79 @@ def add_transaction(transaction_type, category, amount, description, date):
 
 def get_recent_transactions():
     """Get recent transactions for display"""
-    try:
-        if not transactions:
-            return pd.DataFrame(columns=['Date', 'Type', 'Category', 'Amount', 'Description'])
-        
-        df = pd.DataFrame(transactions)
-        df['Date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
-        df = df.sort_values('timestamp', ascending=False).head(10)
-        
-        display_df = df[['Date', 'type', 'category', 'amount', 'description']].copy()
-        display_df.columns = ['Date', 'Type', 'Category', 'Amount', 'Description']
-        display_df['Amount'] = display_df['Amount'].apply(lambda x: f"${x:.2f}")
-        
-        return display_df
-    except Exception as e:
-        return pd.DataFrame(columns=['Date', 'Type', 'Category', 'Amount', 'Description'])
+    # Rows are appended in timestamp order, so the newest ten are the last ten
+    recent = _STORE.iloc[-10:][::-1]
+    
+    return pd.DataFrame({
+        'Date': recent['date'].dt.strftime('%Y-%m-%d'),
+        'Type': recent['type'],
+        'Category': recent['category'],
+        # Format in one C-level pass rather than a Python call per row
+        'Amount': np.char.add('$', np.char.mod('%.2f', recent['amount'].to_numpy())),
+        'Description': recent['description']
+    })
+
+# [start, end) bounds of each relative period, computed from today's date
+_PERIOD_BOUNDS = {
+    "Today": lambda today: (today, today + pd.Timedelta(days=1)),
+    "This Week": lambda today: (today - pd.Timedelta(days=today.weekday()), pd.Timestamp.max),
+    "This Month": lambda today: (today.replace(day=1), pd.Timestamp.max),
+    "This Year": lambda today: (today.replace(month=1, day=1), pd.Timestamp.max)
+}
+
+@lru_cache(maxsize=1)
+def _date_index(n_transactions):
+    """Sort the first n_transactions dates once, returning them with their row positions"""
+    order = np.argsort(_buffers['date'][:n_transactions], kind='stable')
+    return _buffers['date'][:n_transactions][order], order
 
 def filter_transactions_by_period(period, start_date=None, end_date=None):
     """Filter transactions based on time period"""
     try:
-        if not transactions:
-            return pd.DataFrame()
+        df = _STORE
         
-        df = pd.DataFrame(transactions)
-        df['date'] = pd.to_datetime(df['date'])
+        # Resolve the period to half-open [start, end) date bounds
+        if period in _PERIOD_BOUNDS:
+            start, end = _PERIOD_BOUNDS[period](pd.Timestamp(datetime.now().date()))
+        elif period == "Custom Range" and start_date and end_date:
+            # An explicit format takes pandas' C parser instead of dateutil inference
+            start = pd.to_datetime(start_date, format="%Y-%m-%d")
+            end = pd.to_datetime(end_date, format="%Y-%m-%d") + pd.Timedelta(days=1)
+        else:
+            return df
         
-        today = datetime.now().date()
+        if end <= _min_date or start > _max_date:
+            return df.iloc[0:0]
         
-        if period == "Today":
-            filtered_df = df[df['date'].dt.date == today]
-        elif period == "This Week":
-            start_week = today - timedelta(days=today.weekday())
-            filtered_df = df[df['date'].dt.date >= start_week]
-        elif period == "This Month":
-            start_month = today.replace(day=1)
-            filtered_df = df[df['date'].dt.date >= start_month]
-        elif period == "This Year":
-            start_year = today.replace(month=1, day=1)
-            filtered_df = df[df['date'].dt.date >= start_year]
-        elif period == "Custom Range":
-            if start_date and end_date:
-                start_date = pd.to_datetime(start_date).date()
-                end_date = pd.to_datetime(end_date).date()
-                filtered_df = df[(df['date'].dt.date >= start_date) & (df['date'].dt.date <= end_date)]
-            else:
-                filtered_df = df
-        else:
-            filtered_df = df
+        # Binary-search the sorted dates and gather only the matching rows. A bound past
+        # the stored range is taken as the array end, since a far-off date would overflow
+        # when searchsorted casts it to the nanosecond index
+        sorted_dates, order = _date_index(len(df))
+        lo = 0 if start <= _min_date else np.searchsorted(sorted_dates, start.to_datetime64(), side='left')
+        hi = len(sorted_dates) if end > _max_date else np.searchsorted(sorted_dates, end.to_datetime64(), side='left')
+        filtered_df = df.iloc[order[lo:hi]]
         
         return filtered_df
     except Exception as e:
         print(f"Error filtering transactions: {e}")
-        return pd.DataFrame()
+        return _STORE.iloc[0:0]
 
-def create_summary_cards(period, start_date=None, end_date=None):
-    """Create summary statistics"""
-    df = filter_transactions_by_period(period, start_date, end_date)
-    
+def _category_totals(df):
+    """Sum amounts per type and category code as a (types, categories) array"""
+    n_categories = len(_CATEGORY_LABELS)
+    # A flat type/category key lets one weighted bincount replace a hashed groupby
+    keys = df['type'].cat.codes.to_numpy().astype(np.intp) * n_categories + df['category'].cat.codes.to_numpy()
+    totals = np.bincount(keys, weights=df['amount'].to_numpy(), minlength=len(_TYPE_CODES) * n_categories)
+    return totals.reshape(len(_TYPE_CODES), n_categories)
+
+def _summary_cards(df, period, category_totals):
+    """Create summary statistics from a filtered frame and its category totals"""
     if df.empty:
         return "No data available for the selected period"
     
-    total_income = df[df['type'] == 'Income']['amount'].sum()
-    total_expenses = df[df['type'] == 'Expense']['amount'].sum()
+    type_totals = category_totals.sum(axis=1)
+    total_income = type_totals[_TYPE_CODES['Income']]
+    total_expenses = type_totals[_TYPE_CODES['Expense']]
     net_balance = total_income - total_expenses
     
     summary = f"""
@@ -136,132 +266,169 @@ def create_summary_cards(period, start_date=None, end_date=None):
     
     return summary
 
-def create_expense_pie_chart(period, start_date=None, end_date=None):
-    """Create pie chart for expense categories"""
+def create_summary_cards(period, start_date=None, end_date=None):
+    """Create summary statistics"""
     df = filter_transactions_by_period(period, start_date, end_date)
-    expense_df = df[df['type'] == 'Expense']
-    
-    if expense_df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No expense data available", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False,
-                          font=dict(size=16))
-        fig.update_layout(title="Expense Distribution by Category")
-        return fig
-    
-    category_totals = expense_df.groupby('category')['amount'].sum().reset_index()
-    
-    fig = px.pie(category_totals, values='amount', names='category',
-                 title=f"Expense Distribution by Category ({period})",
-                 color_discrete_sequence=px.colors.qualitative.Set3)
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(
-        font=dict(size=12),
-        title_font_size=16,
-        height=400
-    )
-    
-    return fig
+    return _summary_cards(df, period, _category_totals(df))
 
-def create_income_pie_chart(period, start_date=None, end_date=None):
-    """Create pie chart for income categories"""
-    df = filter_transactions_by_period(period, start_date, end_date)
-    income_df = df[df['type'] == 'Income']
-    
-    if income_df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No income data available", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False,
-                          font=dict(size=16))
-        fig.update_layout(title="Income Distribution by Category")
-        return fig
-    
-    category_totals = income_df.groupby('category')['amount'].sum().reset_index()
-    
-    fig = px.pie(category_totals, values='amount', names='category',
-                 title=f"Income Distribution by Category ({period})",
-                 color_discrete_sequence=px.colors.qualitative.Pastel1)
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
+def _figure_template(fig):
+    """Validate a figure once and keep its plain dict form as a reusable template"""
+    template = fig.to_dict()
+    # Drop the expanded default theme; re-validating it dominates figure construction,
+    # and go.Figure applies the same default theme again when the figure is built
+    template['layout'].pop('template', None)
+    return template
+
+def _figure_from_template(template, title=None, trace_values=()):
+    """Build a figure from a template, filling in the title and per-trace data"""
+    layout = template['layout']
+    if title is not None:
+        layout = dict(layout, title=dict(layout['title'], text=title))
+    # Passing None for a trace's values leaves that trace out
+    data = [dict(trace, **values) for trace, values in zip(template['data'], trace_values) if values is not None]
+    return go.Figure({'data': data, 'layout': layout})
+
+def _no_data_template(text, title):
+    """Create a template for a chart that only shows a no-data message"""
+    fig = go.Figure()
+    fig.add_annotation(text=text, 
+                      xref="paper", yref="paper",
+                      x=0.5, y=0.5, showarrow=False,
+                      font=dict(size=16))
+    fig.update_layout(title=title)
+    return _figure_template(fig)
+
+def _pie_template(title, colors):
+    """Create a template for a category distribution pie chart"""
+    fig = go.Figure(go.Pie(
+        marker_colors=colors,
+        textposition='inside',
+        textinfo='percent+label'
+    ))
     fig.update_layout(
+        title=title,
         font=dict(size=12),
         title_font_size=16,
         height=400
     )
-    
-    return fig
+    return _figure_template(fig)
 
-def create_trend_chart(period, start_date=None, end_date=None):
-    """Create line chart showing trends over time"""
-    df = filter_transactions_by_period(period, start_date, end_date)
-    
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available for trend analysis", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False,
-                          font=dict(size=16))
-        fig.update_layout(title="Income vs Expenses Trend")
-        return fig
-    
-    # Group by date and type
-    daily_totals = df.groupby([df['date'].dt.date, 'type'])['amount'].sum().reset_index()
-    daily_totals['date'] = pd.to_datetime(daily_totals['date'])
-    
-    fig = go.Figure()
-    
-    for transaction_type in ['Income', 'Expense']:
-        type_data = daily_totals[daily_totals['type'] == transaction_type]
-        if not type_data.empty:
-            fig.add_trace(go.Scatter(
-                x=type_data['date'],
-                y=type_data['amount'],
-                mode='lines+markers',
-                name=transaction_type,
-                line=dict(width=3)
-            ))
-    
-    fig.update_layout(
-        title=f"Income vs Expenses Trend ({period})",
+# Chart templates, built once at import and reused on every refresh
+_NO_EXPENSE_FIG = _no_data_template("No expense data available", "Expense Distribution by Category")
+_NO_INCOME_FIG = _no_data_template("No income data available", "Income Distribution by Category")
+_NO_TREND_FIG = _no_data_template("No data available for trend analysis", "Income vs Expenses Trend")
+_NO_BAR_FIG = _no_data_template("No data available", "Category Comparison")
+_EXPENSE_PIE_FIG = _pie_template("Expense Distribution by Category", _EXPENSE_COLORS)
+_INCOME_PIE_FIG = _pie_template("Income Distribution by Category", _INCOME_COLORS)
+_TREND_FIG = _figure_template(go.Figure(
+    [go.Scatter(mode='lines+markers', name=t, line=dict(width=3)) for t in ['Income', 'Expense']],
+    layout=dict(
+        title="Income vs Expenses Trend",
         xaxis_title="Date",
         yaxis_title="Amount ($)",
         height=400,
         hovermode='x unified'
     )
-    
-    return fig
-
-def create_bar_chart(period, start_date=None, end_date=None):
-    """Create bar chart comparing categories"""
-    df = filter_transactions_by_period(period, start_date, end_date)
-    
-    if df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No data available", 
-                          xref="paper", yref="paper",
-                          x=0.5, y=0.5, showarrow=False,
-                          font=dict(size=16))
-        fig.update_layout(title="Category Comparison")
-        return fig
-    
-    category_totals = df.groupby(['category', 'type'])['amount'].sum().reset_index()
-    
-    fig = px.bar(category_totals, x='category', y='amount', color='type',
-                 title=f"Category Comparison ({period})",
-                 barmode='group',
-                 color_discrete_map={'Income': '#2E8B57', 'Expense': '#DC143C'})
-    
-    fig.update_layout(
+))
+_BAR_FIG = _figure_template(go.Figure(
+    [go.Bar(name=t, marker_color=_TYPE_COLORS[t]) for t in ['Income', 'Expense']],
+    layout=dict(
+        title="Category Comparison",
+        barmode='group',
+        legend_title_text="Type",
         xaxis_title="Category",
         yaxis_title="Amount ($)",
         height=400,
         xaxis_tickangle=-45
     )
+))
+
+def _expense_pie_chart(category_totals, period):
+    """Create pie chart for expense categories from per-category totals"""
+    expense_totals = category_totals[_TYPE_CODES['Expense']]
+    present = expense_totals > 0
+    
+    if not present.any():
+        return _figure_from_template(_NO_EXPENSE_FIG)
+    
+    return _figure_from_template(
+        _EXPENSE_PIE_FIG,
+        f"Expense Distribution by Category ({period})",
+        [dict(labels=_CATEGORY_LABELS[present], values=expense_totals[present])]
+    )
+
+def create_expense_pie_chart(period, start_date=None, end_date=None):
+    """Create pie chart for expense categories"""
+    return _expense_pie_chart(_category_totals(filter_transactions_by_period(period, start_date, end_date)), period)
+
+def _income_pie_chart(category_totals, period):
+    """Create pie chart for income categories from per-category totals"""
+    income_totals = category_totals[_TYPE_CODES['Income']]
+    present = income_totals > 0
+    
+    if not present.any():
+        return _figure_from_template(_NO_INCOME_FIG)
+    
+    return _figure_from_template(
+        _INCOME_PIE_FIG,
+        f"Income Distribution by Category ({period})",
+        [dict(labels=_CATEGORY_LABELS[present], values=income_totals[present])]
+    )
+
+def create_income_pie_chart(period, start_date=None, end_date=None):
+    """Create pie chart for income categories"""
+    return _income_pie_chart(_category_totals(filter_transactions_by_period(period, start_date, end_date)), period)
+
+def _trend_chart(df, period):
+    """Create line chart showing trends over time from an already filtered frame"""
+    if df.empty:
+        return _figure_from_template(_NO_TREND_FIG)
+    
+    # Bin both types per day in one weighted bincount keyed by day offset and type code
+    days = df['date'].to_numpy().astype('datetime64[D]')
+    first_day = days.min()
+    day_offsets = (days - first_day).astype(np.intp)
+    n_days = day_offsets.max() + 1
+    keys = day_offsets * len(_TYPE_CODES) + df['type'].cat.codes.to_numpy()
+    daily_totals = np.bincount(
+        keys, weights=df['amount'].to_numpy(), minlength=n_days * len(_TYPE_CODES)
+    ).reshape(n_days, len(_TYPE_CODES))
+    # Only plot days that have at least one transaction
+    active_days = np.flatnonzero(np.bincount(day_offsets))
+    daily_totals = daily_totals[active_days]
+    
+    return _figure_from_template(
+        _TREND_FIG,
+        f"Income vs Expenses Trend ({period})",
+        [
+            dict(x=first_day + active_days, y=daily_totals[:, _TYPE_CODES[transaction_type]])
+            if daily_totals[:, _TYPE_CODES[transaction_type]].any() else None
+            for transaction_type in ['Income', 'Expense']
+        ]
+    )
+
+def create_trend_chart(period, start_date=None, end_date=None):
+    """Create line chart showing trends over time"""
+    return _trend_chart(filter_transactions_by_period(period, start_date, end_date), period)
+
+def _bar_chart(category_totals, period):
+    """Create bar chart comparing categories from per-category totals"""
+    if not category_totals.any():
+        return _figure_from_template(_NO_BAR_FIG)
+    
+    trace_values = []
+    for transaction_type in ['Income', 'Expense']:
+        type_totals = category_totals[_TYPE_CODES[transaction_type]]
+        present = type_totals > 0
+        trace_values.append(
+            dict(x=_CATEGORY_LABELS[present], y=type_totals[present]) if present.any() else None
+        )
     
-    return fig
+    return _figure_from_template(_BAR_FIG, f"Category Comparison ({period})", trace_values)
+
+def create_bar_chart(period, start_date=None, end_date=None):
+    """Create bar chart comparing categories"""
+    return _bar_chart(_category_totals(filter_transactions_by_period(period, start_date, end_date)), period)
 
 def update_category_choices(transaction_type):
     """Update category dropdown based on transaction type"""
@@ -270,16 +437,29 @@ def update_category_choices(transaction_type):
     else:
         return gr.Dropdown(choices=EXPENSE_CATEGORIES, value="")
 
-def update_charts(period, start_date, end_date):
-    """Update all charts based on selected period"""
+def _build_charts(df, period):
+    """Build the summary and all charts from one filtered frame"""
+    # The summary, pies and bar chart all read one shared aggregation pass
+    category_totals = _category_totals(df)
     return (
-        create_summary_cards(period, start_date, end_date),
-        create_expense_pie_chart(period, start_date, end_date),
-        create_income_pie_chart(period, start_date, end_date),
-        create_trend_chart(period, start_date, end_date),
-        create_bar_chart(period, start_date, end_date)
+        _summary_cards(df, period, category_totals),
+        _expense_pie_chart(category_totals, period),
+        _income_pie_chart(category_totals, period),
+        _trend_chart(df, period),
+        _bar_chart(category_totals, period)
     )
 
+@lru_cache(maxsize=16)
+def _cached_charts(period, start_date, end_date, n_transactions, today):
+    """Build charts once per period, data version and day"""
+    df = filter_transactions_by_period(period, start_date, end_date)
+    return _build_charts(df, period)
+
+def update_charts(period, start_date, end_date):
+    """Update all charts based on selected period"""
+    # The store is append-only, so its length identifies the data version
+    return _cached_charts(period, start_date, end_date, len(_STORE), datetime.now().date())
+
 def show_custom_date_inputs(period):
     """Show/hide custom date inputs based on period selection"""
     if period == "Custom Range":